@@ -4,3 +4,9 @@ META_FILE = "db_meta.json"
 DATA_DIR = "data"
 
 VALID_TYPES = ("int", "str", "bool")
+
+# Сколько строк запрос держит в памяти при сортировке, если
+# переменная окружения MEMORY_BUDGET_ENV не задана;
+# всё, что не помещается, сбрасывается во временные файлы.
+DEFAULT_QUERY_MEMORY_BUDGET = 10000
+MEMORY_BUDGET_ENV = "PRIMITIVE_DB_MEMORY_BUDGET"
@@ -1,6 +1,6 @@
 """Бизнес-логика примитивной базы данных."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from .constants import VALID_TYPES
 
@@ -40,6 +40,8 @@ def create_table(
             {"name": name, "type": col_type}
             for name, col_type in full_columns
         ],
+        "row_count": 0,
+        "size_bytes": 0,
     }
     return metadata
 
@@ -52,10 +54,241 @@ def drop_table(
     if table_name not in metadata:
         raise ValueError(f'Ошибка: Таблица "{table_name}" не существует.')
 
+    views = get_views(metadata, table_name)
+    if views:
+        raise ValueError(
+            f'Ошибка: Таблица "{table_name}" используется в представлениях: '
+            f'{", ".join(views)}.',
+        )
+
     del metadata[table_name]
     return metadata
 
 
+def alter_table_add(
+    metadata: Dict[str, Any],
+    table_name: str,
+    column_name: str,
+    col_type: str,
+    default: Any = None,
+) -> Dict[str, Any]:
+    """Добавляет столбец в схему таблицы без перезаписи данных.
+
+    Старые строки получают значение default при чтении.
+    """
+    _check_writable(metadata, table_name)
+    columns = _get_table_schema(metadata, table_name)
+    table_info = metadata[table_name]
+
+    if any(c["name"] == column_name for c in columns):
+        raise ValueError(f'Ошибка: столбец "{column_name}" уже существует.')
+    if column_name in table_info.get("dropped", []):
+        raise ValueError(
+            f'Ошибка: столбец "{column_name}" удалён, но ещё хранится в данных. '
+            f"Выполните compact {table_name} и попробуйте снова.",
+        )
+    if col_type not in VALID_TYPES:
+        raise ValueError(
+            f"Некорректный тип столбца: {col_type}. "
+            "Допустимые типы: int, str, bool.",
+        )
+
+    column: Dict[str, Any] = {"name": column_name, "type": col_type}
+    if default is not None:
+        _validate_type(col_type, default)
+        column["default"] = default
+    columns.append(column)
+    table_info["schema_version"] = table_info.get("schema_version", 1) + 1
+    return metadata
+
+
+def alter_table_drop(
+    metadata: Dict[str, Any],
+    table_name: str,
+    column_name: str,
+) -> Dict[str, Any]:
+    """Удаляет столбец из схемы таблицы без перезаписи данных.
+
+    Значения столбца скрываются при чтении и исчезают из файла
+    при следующей перезаписи таблицы.
+    """
+    _check_writable(metadata, table_name)
+    columns = _get_table_schema(metadata, table_name)
+    table_info = metadata[table_name]
+
+    if column_name == "ID":
+        raise ValueError("Ошибка: столбец ID нельзя удалить.")
+    _check_columns(metadata, table_name, [column_name])
+    for view_name in get_views(metadata, table_name):
+        if column_name in view_source_columns(metadata, view_name):
+            raise ValueError(
+                f'Ошибка: столбец "{column_name}" используется '
+                f'в представлении "{view_name}".',
+            )
+
+    table_info["columns"] = [c for c in columns if c["name"] != column_name]
+    table_info.setdefault("dropped", []).append(column_name)
+    table_info["schema_version"] = table_info.get("schema_version", 1) + 1
+    return metadata
+
+
+def compact_table(
+    metadata: Dict[str, Any],
+    table_name: str,
+) -> Dict[str, Any]:
+    """Отмечает, что данные таблицы перезаписаны по текущей схеме."""
+    _get_table_schema(metadata, table_name)
+    metadata[table_name].pop("dropped", None)
+    return metadata
+
+
+def columns_of_type(
+    metadata: Dict[str, Any],
+    table_name: str,
+    col_type: str,
+) -> List[str]:
+    """Возвращает имена столбцов таблицы заданного типа."""
+    columns = _get_table_schema(metadata, table_name)
+    return [c["name"] for c in columns if c["type"] == col_type]
+
+
+def schema_defaults(
+    metadata: Dict[str, Any],
+    table_name: str,
+) -> Dict[str, Any]:
+    """Возвращает значения по умолчанию для всех столбцов таблицы."""
+    columns = _get_table_schema(metadata, table_name)
+    return {c["name"]: c.get("default") for c in columns}
+
+
+def is_view(metadata: Dict[str, Any], table_name: str) -> bool:
+    """Проверяет, является ли таблица материализованным представлением."""
+    return "view" in metadata.get(table_name, {})
+
+
+def get_views(metadata: Dict[str, Any], table_name: str) -> List[str]:
+    """Возвращает имена представлений, построенных по таблице."""
+    return [
+        name
+        for name, info in metadata.items()
+        if info.get("view", {}).get("table") == table_name
+    ]
+
+
+def _check_writable(metadata: Dict[str, Any], table_name: str) -> None:
+    """Запрещает прямое изменение представлений."""
+    if is_view(metadata, table_name):
+        raise ValueError(
+            f'Ошибка: "{table_name}" является представлением '
+            "и не может изменяться напрямую.",
+        )
+
+
+def _row_matches(row: Dict[str, Any], where_clause: Dict[str, Any]) -> bool:
+    """Проверяет, удовлетворяет ли строка условию."""
+    for col, value in where_clause.items():
+        if row.get(col) != value:
+            return False
+    return True
+
+
+def create_view(
+    metadata: Dict[str, Any],
+    view_name: str,
+    table_name: str,
+    columns: List[str] | None,
+    where_clause: Dict[str, Any] | None,
+) -> Dict[str, Any]:
+    """Создаёт материализованное представление и добавляет его в metadata."""
+    if view_name in metadata:
+        raise ValueError(f'Ошибка: Таблица "{view_name}" уже существует.')
+
+    schema = _get_table_schema(metadata, table_name)
+    if is_view(metadata, table_name):
+        raise ValueError(
+            "Ошибка: представление можно построить только по таблице.",
+        )
+
+    if columns is None:
+        columns = [c["name"] for c in schema]
+    elif "ID" not in columns:
+        columns = ["ID", *columns]
+    _check_columns(metadata, table_name, columns)
+    _check_columns(metadata, table_name, list(where_clause or {}))
+
+    schema_by_name = {c["name"]: c for c in schema}
+    metadata[view_name] = {
+        "columns": [dict(schema_by_name[col]) for col in columns],
+        "view": {"table": table_name, "where": dict(where_clause or {})},
+    }
+    return metadata
+
+
+def view_source_columns(
+    metadata: Dict[str, Any],
+    view_name: str,
+) -> List[str]:
+    """Возвращает столбцы базовой таблицы, нужные для представления."""
+    view = metadata[view_name]
+    needed = [c["name"] for c in view["columns"]]
+    for col in view["view"]["where"]:
+        if col not in needed:
+            needed.append(col)
+    return needed
+
+
+def build_view_rows(
+    metadata: Dict[str, Any],
+    view_name: str,
+    table_data: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Полностью вычисляет строки представления по базовой таблице."""
+    view = metadata[view_name]
+    columns = [c["name"] for c in view["columns"]]
+    where_clause = view["view"]["where"]
+    return [
+        {col: row.get(col) for col in columns}
+        for row in table_data
+        if _row_matches(row, where_clause)
+    ]
+
+
+def apply_view_changes(
+    metadata: Dict[str, Any],
+    view_name: str,
+    view_data: List[Dict[str, Any]],
+    changed_rows: List[Dict[str, Any]],
+    deleted_ids: List[int],
+) -> List[Dict[str, Any]]:
+    """Инкрементально применяет изменения базовой таблицы к представлению.
+
+    Каждая изменённая строка заново проверяется условием представления,
+    удалённые строки убираются по ID; базовая таблица не перечитывается.
+    """
+    view = metadata[view_name]
+    columns = [c["name"] for c in view["columns"]]
+    where_clause = view["view"]["where"]
+
+    deleted = set(deleted_ids)
+    changed = {int(row["ID"]): row for row in changed_rows}
+
+    result: List[Dict[str, Any]] = []
+    for row in view_data:
+        row_id = int(row["ID"])
+        if row_id in deleted:
+            continue
+        source = changed.pop(row_id, None)
+        if source is None:
+            result.append(row)
+        elif _row_matches(source, where_clause):
+            result.append({col: source.get(col) for col in columns})
+
+    for source in changed.values():
+        if _row_matches(source, where_clause):
+            result.append({col: source.get(col) for col in columns})
+    return result
+
+
 def _next_id(table_data: List[Dict[str, Any]]) -> int:
     """Находит следующий ID."""
     if not table_data:
@@ -81,6 +314,7 @@ def insert_row(
     table_data: List[Dict[str, Any]],
 ) -> Tuple[List[Dict[str, Any]], int]:
     """Добавляет новую строку в таблицу."""
+    _check_writable(metadata, table_name)
     columns = _get_table_schema(metadata, table_name)
     non_id_columns = [c for c in columns if c["name"] != "ID"]
 
@@ -99,28 +333,96 @@ def insert_row(
     return table_data, row_id
 
 
+def _check_columns(
+    metadata: Dict[str, Any],
+    table_name: str,
+    columns: List[str],
+) -> None:
+    """Проверяет, что все столбцы есть в схеме таблицы."""
+    column_names = {c["name"] for c in _get_table_schema(metadata, table_name)}
+    for col in columns:
+        if col not in column_names:
+            raise ValueError(f'Ошибка: столбец "{col}" не существует.')
+
+
+def check_where_columns(
+    metadata: Dict[str, Any],
+    table_name: str,
+    where_clause: Dict[str, Any] | None,
+) -> None:
+    """Проверяет, что условие ссылается только на столбцы текущей схемы.
+
+    Удалённые через alter_table столбцы ещё могут храниться в файле,
+    поэтому фильтровать по ним нельзя.
+    """
+    _check_columns(metadata, table_name, list(where_clause or {}))
+
+
+def columns_to_load(
+    metadata: Dict[str, Any],
+    table_name: str,
+    columns: List[str] | None,
+    where_clause: Dict[str, Any] | None,
+    order_column: str | None = None,
+) -> List[str] | None:
+    """Определяет столбцы, которые нужно прочитать для выборки."""
+    check_where_columns(metadata, table_name, where_clause)
+    if order_column is not None:
+        _check_columns(metadata, table_name, [order_column])
+    if columns is None:
+        _get_table_schema(metadata, table_name)
+        return None
+
+    extra = list(where_clause or {})
+    if order_column is not None:
+        extra.append(order_column)
+
+    needed = list(columns)
+    for col in extra:
+        if col not in needed:
+            needed.append(col)
+    _check_columns(metadata, table_name, needed)
+    return needed
+
+
+def iter_select_rows(
+    metadata: Dict[str, Any],
+    table_name: str,
+    table_data: Iterable[Dict[str, Any]],
+    where_clause: Dict[str, Any] | None,
+    columns: List[str] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Лениво отбирает строки по условию и оставляет только столбцы columns."""
+    _get_table_schema(metadata, table_name)
+    if columns is not None:
+        _check_columns(metadata, table_name, columns)
+
+    def select() -> Iterator[Dict[str, Any]]:
+        for row in table_data:
+            if where_clause and not _row_matches(row, where_clause):
+                continue
+            if columns is None:
+                yield row
+            else:
+                yield {col: row.get(col) for col in columns}
+
+    return select()
+
+
 def select_rows(
     metadata: Dict[str, Any],
     table_name: str,
     table_data: List[Dict[str, Any]],
     where_clause: Dict[str, Any] | None,
+    columns: List[str] | None = None,
 ) -> List[Dict[str, Any]]:
-    """Возвращает строки по условию или все строки."""
-    _get_table_schema(metadata, table_name)
+    """Возвращает строки по условию или все строки.
 
-    if not where_clause:
-        return list(table_data)
-
-    result: List[Dict[str, Any]] = []
-    for row in table_data:
-        matches = True
-        for col, value in where_clause.items():
-            if row.get(col) != value:
-                matches = False
-                break
-        if matches:
-            result.append(row)
-    return result
+    Если передан список columns, в результат попадают только эти столбцы.
+    """
+    return list(
+        iter_select_rows(metadata, table_name, table_data, where_clause, columns),
+    )
 
 
 def update_rows(
@@ -129,22 +431,29 @@ def update_rows(
     table_data: List[Dict[str, Any]],
     set_clause: Dict[str, Any],
     where_clause: Dict[str, Any],
+    matched: List[int] | None = None,
 ) -> Tuple[List[Dict[str, Any]], List[int]]:
-    """Обновляет строки по условию."""
+    """Обновляет строки по условию.
+
+    Если передан matched, условие уже проверено при загрузке
+    и обновляются строки с этими позициями.
+    """
+    _check_writable(metadata, table_name)
     columns = _get_table_schema(metadata, table_name)
     column_names = {c["name"] for c in columns}
+    check_where_columns(metadata, table_name, where_clause)
 
     for col in set_clause:
         if col not in column_names:
             raise ValueError(f'Ошибка: столбец "{col}" не существует.')
 
+    positions = set(matched) if matched is not None else None
     updated_ids: List[int] = []
-    for row in table_data:
-        matches = True
-        for col, value in where_clause.items():
-            if row.get(col) != value:
-                matches = False
-                break
+    for index, row in enumerate(table_data):
+        if positions is not None:
+            matches = index in positions
+        else:
+            matches = _row_matches(row, where_clause)
         if not matches:
             continue
 
@@ -163,19 +472,25 @@ def delete_rows(
     table_name: str,
     table_data: List[Dict[str, Any]],
     where_clause: Dict[str, Any],
+    matched: List[int] | None = None,
 ) -> Tuple[List[Dict[str, Any]], List[int]]:
-    """Удаляет строки по условию."""
-    _get_table_schema(metadata, table_name)
+    """Удаляет строки по условию.
 
+    Если передан matched, условие уже проверено при загрузке
+    и удаляются строки с этими позициями.
+    """
+    _check_writable(metadata, table_name)
+    check_where_columns(metadata, table_name, where_clause)
+
+    positions = set(matched) if matched is not None else None
     remaining: List[Dict[str, Any]] = []
     deleted_ids: List[int] = []
 
-    for row in table_data:
-        matches = True
-        for col, value in where_clause.items():
-            if row.get(col) != value:
-                matches = False
-                break
+    for index, row in enumerate(table_data):
+        if positions is not None:
+            matches = index in positions
+        else:
+            matches = _row_matches(row, where_clause)
         if matches:
             deleted_ids.append(int(row.get("ID", 0)))
         else:
@@ -184,19 +499,41 @@ def delete_rows(
     return remaining, deleted_ids
 
 
+def update_table_stats(
+    metadata: Dict[str, Any],
+    table_name: str,
+    row_count: int,
+    size_bytes: int,
+) -> Dict[str, Any]:
+    """Сохраняет в metadata число записей и размер файла таблицы."""
+    _get_table_schema(metadata, table_name)
+    metadata[table_name]["row_count"] = row_count
+    metadata[table_name]["size_bytes"] = size_bytes
+    return metadata
+
+
+def has_table_stats(metadata: Dict[str, Any], table_name: str) -> bool:
+    """Проверяет, есть ли в metadata статистика таблицы."""
+    _get_table_schema(metadata, table_name)
+    return "row_count" in metadata[table_name]
+
+
 def get_table_info(
     metadata: Dict[str, Any],
     table_name: str,
-    table_data: List[Dict[str, Any]],
 ) -> str:
-    """Формирует строку с информацией о таблице."""
+    """Формирует строку с информацией о таблице по метаданным."""
     columns = _get_table_schema(metadata, table_name)
     columns_str = ", ".join(f'{c["name"]}:{c["type"]}' for c in columns)
-    count = len(table_data)
+    table_info = metadata[table_name]
 
     lines = [
         f"Таблица: {table_name}",
         f"Столбцы: {columns_str}",
-        f"Количество записей: {count}",
+        f"Количество записей: {table_info.get('row_count', 0)}",
+        f"Размер файла: {table_info.get('size_bytes', 0)} байт",
     ]
+    schema_version = table_info.get("schema_version")
+    if schema_version is not None:
+        lines.append(f"Версия схемы: {schema_version}")
     return "\n".join(lines)
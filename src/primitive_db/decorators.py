@@ -67,14 +67,25 @@ def log_time(func: FuncType) -> FuncType:
 
 
 def create_cacher() -> Callable[[Any, Callable[[], Any]], Any]:
-    """Создаёт функцию-замыкание для кэширования результатов."""
+    """Создаёт функцию-замыкание для кэширования результатов.
+
+    Результат None не кэшируется. У функции есть атрибут
+    invalidate(predicate), который удаляет из кэша все ключи,
+    для которых predicate возвращает True.
+    """
     cache: Dict[Any, Any] = {}
 
     def cache_result(key: Any, value_func: Callable[[], Any]) -> Any:
         if key in cache:
             return cache[key]
         value = value_func()
-        cache[key] = value
+        if value is not None:
+            cache[key] = value
         return value
 
+    def invalidate(predicate: Callable[[Any], bool]) -> None:
+        for key in [k for k in cache if predicate(k)]:
+            del cache[key]
+
+    cache_result.invalidate = invalidate  # type: ignore[attr-defined]
     return cache_result
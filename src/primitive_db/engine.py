@@ -2,9 +2,8 @@
 """Точка входа и игровой цикл для примитивной базы данных."""
 
 import shlex
-
-import prompt
-from prettytable import PrettyTable
+from itertools import chain, islice
+from typing import Iterable, Iterator
 
 from . import core
 from . import parser as db_parser
@@ -15,9 +14,14 @@ from .decorators import (
     handle_db_errors,
     log_time,
 )
+from .sorting import query_memory_budget, sort_rows
 from .utils import (
+    delete_table_data,
+    get_table_size,
+    iter_table_data,
     load_metadata,
     load_table_data,
+    load_table_matches,
     save_metadata,
     save_table_data,
 )
@@ -25,6 +29,91 @@ from .utils import (
 SELECT_CACHE = create_cacher()
 
 
+def _invalidate_cache(table_name: str) -> None:
+    """Удаляет из кэша select все результаты по таблице."""
+    SELECT_CACHE.invalidate(lambda key: key[0] == table_name)
+
+
+def _scan_columns(
+    metadata: dict,
+    table_name: str,
+    columns: list[str] | None,
+) -> tuple[list[str], dict]:
+    """Возвращает столбцы для чтения и значения по умолчанию текущей схемы."""
+    defaults = core.schema_defaults(metadata, table_name)
+    if columns is None:
+        columns = list(defaults)
+    return columns, defaults
+
+
+def _iter_table(
+    metadata: dict,
+    table_name: str,
+    columns: list[str] | None = None,
+    where_clause: dict | None = None,
+) -> Iterator[dict]:
+    """Читает строки таблицы с учётом текущей версии схемы."""
+    columns, defaults = _scan_columns(metadata, table_name, columns)
+    return iter_table_data(table_name, columns, where_clause, defaults)
+
+
+def _load_table(
+    metadata: dict,
+    table_name: str,
+    columns: list[str] | None = None,
+    where_clause: dict | None = None,
+) -> list[dict]:
+    """Загружает строки таблицы списком с учётом текущей версии схемы."""
+    columns, defaults = _scan_columns(metadata, table_name, columns)
+    return load_table_data(table_name, columns, where_clause, defaults)
+
+
+def _load_table_matches(
+    metadata: dict,
+    table_name: str,
+    where_clause: dict,
+) -> tuple[list[dict], list[int]]:
+    """Загружает строки таблицы и позиции строк, подходящих под условие."""
+    core.check_where_columns(metadata, table_name, where_clause)
+    columns, defaults = _scan_columns(metadata, table_name, None)
+    return load_table_matches(table_name, where_clause, columns, defaults)
+
+
+def _save_table(metadata: dict, table_name: str, table_data: list[dict]) -> None:
+    """Сохраняет таблицу и обновляет её статистику в метаданных.
+
+    Перезапись файла также завершает отложенные ALTER.
+    """
+    size_bytes = save_table_data(
+        table_name,
+        table_data,
+        core.columns_of_type(metadata, table_name, "str"),
+    )
+    _invalidate_cache(table_name)
+    core.compact_table(metadata, table_name)
+    core.update_table_stats(metadata, table_name, len(table_data), size_bytes)
+    save_metadata(META_FILE, metadata)
+
+
+def _refresh_views(
+    metadata: dict,
+    table_name: str,
+    changed_rows: list[dict],
+    deleted_ids: list[int],
+) -> None:
+    """Применяет изменения базовой таблицы к её представлениям."""
+    for view_name in core.get_views(metadata, table_name):
+        view_data = _load_table(metadata, view_name)
+        view_data = core.apply_view_changes(
+            metadata,
+            view_name,
+            view_data,
+            changed_rows,
+            deleted_ids,
+        )
+        _save_table(metadata, view_name, view_data)
+
+
 def print_help() -> None:
     """Печатает справочную информацию по доступным командам."""
     print("\n***Процесс работы с таблицей***")
@@ -32,6 +121,21 @@ def print_help() -> None:
     print("<command> create_table <имя_таблицы> <столбец1:тип> .. - создать таблицу")
     print("<command> list_tables - показать список всех таблиц")
     print("<command> drop_table <имя_таблицы> - удалить таблицу")
+    print(
+        "<command> alter_table <имя_таблицы> add <столбец:тип> "
+        "[default <значение>] - добавить столбец"
+    )
+    print(
+        "<command> alter_table <имя_таблицы> drop <столбец> - удалить столбец"
+    )
+    print(
+        "<command> compact <имя_таблицы> - перезаписать файл таблицы "
+        "по текущей схеме"
+    )
+    print(
+        "<command> create view <имя> as select ... from <имя_таблицы> "
+        "where <столбец> = <значение> - создать материализованное представление"
+    )
 
     print("\n***Операции с данными***")
     print(
@@ -43,6 +147,14 @@ def print_help() -> None:
         "- прочитать записи по условию."
     )
     print("<command> select from <имя_таблицы> - прочитать все записи.")
+    print(
+        "<command> select <столбец1>, <столбец2> from <имя_таблицы> ... "
+        "- прочитать только указанные столбцы."
+    )
+    print(
+        "<command> select ... from <имя_таблицы> ... order by <столбец> "
+        "[asc|desc] - отсортировать результат."
+    )
     print(
         "<command> update <имя_таблицы> set <столбец1> = <новое_значение1> "
         "where <столбец_условия> = <значение_условия> - обновить запись."
@@ -58,9 +170,16 @@ def print_help() -> None:
     print("<command> help - справочная информация\n")
 
 
-def welcome() -> None:
-    """Начальное приветствие и пример работы команды help."""
-    name = prompt.string("May I have your name? ")
+def welcome(ask_name: bool = True) -> None:
+    """Начальное приветствие и пример работы команды help.
+
+    Имя спрашивается только при ask_name=True, иначе используется "user".
+    """
+    name = None
+    if ask_name:
+        import prompt
+
+        name = prompt.string("May I have your name? ")
     if not name:
         name = "user"
 
@@ -97,6 +216,35 @@ def handle_create_table(tokens: list[str]) -> None:
     )
 
 
+@handle_db_errors
+def handle_create_view(command: str) -> None:
+    """Создание материализованного представления по команде create view."""
+    view_name, table_name, columns, where_clause = (
+        db_parser.parse_create_view_command(command)
+    )
+
+    metadata = load_metadata(META_FILE)
+    metadata = core.create_view(
+        metadata,
+        view_name,
+        table_name,
+        columns,
+        where_clause,
+    )
+    table_data = _load_table(
+        metadata,
+        table_name,
+        core.view_source_columns(metadata, view_name),
+    )
+    view_data = core.build_view_rows(metadata, view_name, table_data)
+    _save_table(metadata, view_name, view_data)
+
+    print(
+        f'Представление "{view_name}" успешно создано, '
+        f"записей: {len(view_data)}.",
+    )
+
+
 @handle_db_errors
 @confirm_action("удаление таблицы")
 def handle_drop_table(tokens: list[str]) -> None:
@@ -111,9 +259,53 @@ def handle_drop_table(tokens: list[str]) -> None:
     metadata = load_metadata(META_FILE)
     metadata = core.drop_table(metadata, table_name)
     save_metadata(META_FILE, metadata)
+    delete_table_data(table_name)
+    _invalidate_cache(table_name)
     print(f'Таблица "{table_name}" успешно удалена.')
 
 
+@handle_db_errors
+def handle_alter_table(command: str) -> None:
+    """Изменение схемы таблицы по команде alter_table."""
+    table_name, action, column_name, col_type, default = (
+        db_parser.parse_alter_command(command)
+    )
+
+    metadata = load_metadata(META_FILE)
+    if action == "add":
+        metadata = core.alter_table_add(
+            metadata,
+            table_name,
+            column_name,
+            col_type,
+            default,
+        )
+        message = f'Столбец "{column_name}" добавлен в таблицу "{table_name}".'
+    else:
+        metadata = core.alter_table_drop(metadata, table_name, column_name)
+        message = f'Столбец "{column_name}" удалён из таблицы "{table_name}".'
+    save_metadata(META_FILE, metadata)
+    _invalidate_cache(table_name)
+    print(message)
+
+
+@handle_db_errors
+@log_time
+def handle_compact(tokens: list[str]) -> None:
+    """Перезапись файла таблицы по текущей схеме."""
+    if len(tokens) != 2:
+        raise ValueError(
+            "Некорректное значение: нужно указать имя таблицы. "
+            "Попробуйте снова.",
+        )
+
+    table_name = tokens[1]
+    metadata = load_metadata(META_FILE)
+    table_data = _load_table(metadata, table_name)
+    _save_table(metadata, table_name, table_data)
+    print(f'Таблица "{table_name}" перезаписана по текущей схеме.')
+
+
 @handle_db_errors
 def handle_list_tables() -> None:
     """Вывод списка таблиц."""
@@ -123,7 +315,10 @@ def handle_list_tables() -> None:
         return
 
     for name in metadata:
-        print(f"- {name}")
+        if core.is_view(metadata, name):
+            print(f"- {name} (представление)")
+        else:
+            print(f"- {name}")
 
 
 @handle_db_errors
@@ -133,41 +328,102 @@ def handle_insert(command: str) -> None:
     table_name, values = db_parser.parse_insert_command(command)
 
     metadata = load_metadata(META_FILE)
-    table_data = load_table_data(table_name)
+    table_data = _load_table(metadata, table_name)
     table_data, new_id = core.insert_row(metadata, table_name, values, table_data)
-    save_table_data(table_name, table_data)
+    _save_table(metadata, table_name, table_data)
+    _refresh_views(metadata, table_name, [table_data[-1]], [])
     print(
         f'Запись с ID={new_id} успешно добавлена в таблицу "{table_name}".',
     )
 
 
+def _print_rows(rows: Iterable[dict], page_size: int | None = None) -> None:
+    """Печатает строки таблицей.
+
+    Если задан page_size, строки печатаются потоком, отдельными таблицами
+    не больше page_size строк, чтобы не держать весь результат в памяти.
+    """
+    table = None
+    field_names: list[str] = []
+    printed = False
+    for row in rows:
+        if table is None:
+            from prettytable import PrettyTable
+
+            field_names = field_names or list(row.keys())
+            table = PrettyTable()
+            table.field_names = field_names
+        table.add_row([row.get(name, "") for name in field_names])
+        if page_size is not None and len(table.rows) >= page_size:
+            print(table)
+            table = None
+            printed = True
+
+    if table is not None:
+        print(table)
+    elif not printed:
+        print("Записей не найдено.")
+
+
 @handle_db_errors
 @log_time
 def handle_select(command: str) -> None:
     """Обработка команды select."""
-    table_name, where_clause = db_parser.parse_select_command(command)
+    table_name, columns, where_clause, order_by = (
+        db_parser.parse_select_command(command)
+    )
 
-    def compute():
+    if order_by is not None:
+        order_column, descending = order_by
         metadata = load_metadata(META_FILE)
-        table_data = load_table_data(table_name)
-        return core.select_rows(metadata, table_name, table_data, where_clause)
+        load_columns = core.columns_to_load(
+            metadata,
+            table_name,
+            columns,
+            where_clause,
+            order_column,
+        )
+        rows = _iter_table(metadata, table_name, load_columns, where_clause)
+        budget = query_memory_budget()
+        rows = sort_rows(rows, order_column, descending, budget)
+        rows = core.iter_select_rows(metadata, table_name, rows, None, columns)
+        _print_rows(rows, budget)
+        return
+
+    overflow: list[Iterator[dict]] = []
 
-    cache_key = (table_name, None)
+    def compute():
+        metadata = load_metadata(META_FILE)
+        load_columns = core.columns_to_load(
+            metadata,
+            table_name,
+            columns,
+            where_clause,
+        )
+        table_data = _iter_table(metadata, table_name, load_columns, where_clause)
+        rows = core.iter_select_rows(metadata, table_name, table_data, None, columns)
+
+        budget = query_memory_budget()
+        head = list(islice(rows, budget + 1))
+        if len(head) > budget:
+            overflow.append(chain(head, rows))
+            return None
+        return head
+
+    projection = tuple(columns) if columns else None
+    cache_key = (table_name, projection, None)
     if where_clause:
-        cache_key = (table_name, tuple(sorted(where_clause.items())))
+        cache_key = (
+            table_name,
+            projection,
+            tuple(sorted(where_clause.items())),
+        )
 
     rows = SELECT_CACHE(cache_key, compute)
-    if not rows:
-        print("Записей не найдено.")
+    if rows is None:
+        _print_rows(overflow[0], query_memory_budget())
         return
-
-    field_names = list(rows[0].keys())
-    table = PrettyTable()
-    table.field_names = field_names
-    for row in rows:
-        table.add_row([row.get(name, "") for name in field_names])
-
-    print(table)
+    _print_rows(rows)
 
 
 @handle_db_errors
@@ -177,15 +433,23 @@ def handle_update(command: str) -> None:
     table_name, set_clause, where_clause = db_parser.parse_update_command(command)
 
     metadata = load_metadata(META_FILE)
-    table_data = load_table_data(table_name)
+    table_data, matched = _load_table_matches(metadata, table_name, where_clause)
     table_data, updated_ids = core.update_rows(
         metadata,
         table_name,
         table_data,
         set_clause,
         where_clause,
+        matched,
+    )
+    _save_table(metadata, table_name, table_data)
+    updated = set(updated_ids)
+    _refresh_views(
+        metadata,
+        table_name,
+        [row for row in table_data if int(row["ID"]) in updated],
+        [],
     )
-    save_table_data(table_name, table_data)
 
     if not updated_ids:
         print("Подходящих записей не найдено.")
@@ -206,14 +470,16 @@ def handle_delete(command: str) -> None:
     table_name, where_clause = db_parser.parse_delete_command(command)
 
     metadata = load_metadata(META_FILE)
-    table_data = load_table_data(table_name)
+    table_data, matched = _load_table_matches(metadata, table_name, where_clause)
     table_data, deleted_ids = core.delete_rows(
         metadata,
         table_name,
         table_data,
         where_clause,
+        matched,
     )
-    save_table_data(table_name, table_data)
+    _save_table(metadata, table_name, table_data)
+    _refresh_views(metadata, table_name, [], deleted_ids)
 
     if not deleted_ids:
         print("Подходящих записей не найдено.")
@@ -237,8 +503,16 @@ def handle_info(tokens: list[str]) -> None:
 
     table_name = tokens[1]
     metadata = load_metadata(META_FILE)
-    table_data = load_table_data(table_name)
-    info = core.get_table_info(metadata, table_name, table_data)
+    if not core.has_table_stats(metadata, table_name):
+        table_data = _load_table(metadata, table_name, ["ID"])
+        core.update_table_stats(
+            metadata,
+            table_name,
+            len(table_data),
+            get_table_size(table_name),
+        )
+        save_metadata(META_FILE, metadata)
+    info = core.get_table_info(metadata, table_name)
     print(info)
 
 
@@ -274,6 +548,12 @@ def run() -> None:
             handle_create_table(tokens)
         elif command == "list_tables":
             handle_list_tables()
+        elif lower.startswith("create view"):
+            handle_create_view(user_input)
+        elif command == "alter_table":
+            handle_alter_table(user_input)
+        elif command == "compact":
+            handle_compact(tokens)
         elif command == "drop_table":
             handle_drop_table(tokens)
         elif lower.startswith("insert into"):
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Точка входа в приложение primitive_db."""
 
+import sys
+
 from .engine import run, welcome
 
 
 def main() -> None:
-    """Запускает приветствие и основной цикл."""
-    welcome()
+    """Запускает приветствие и основной цикл.
+
+    Имя пользователя спрашивается только в интерактивном терминале.
+    """
+    welcome(ask_name=sys.stdin.isatty())
     run()
 
 
@@ -84,25 +84,113 @@ def parse_insert_command(command: str) -> tuple[str, List[Any]]:
     return table_name, values
 
 
-def parse_select_command(command: str) -> tuple[str, Dict[str, Any] | None]:
+def parse_projection(select_part: str) -> List[str] | None:
+    """Парсит список столбцов между select и from."""
+    text = select_part.strip()
+    if text.lower().startswith("select"):
+        text = text[len("select"):].strip()
+    if not text or text == "*":
+        return None
+
+    columns: List[str] = []
+    for item in text.split(","):
+        name = item.strip()
+        if not name:
+            raise ValueError(f"Некорректное значение: {text}. Попробуйте снова.")
+        if name not in columns:
+            columns.append(name)
+    return columns
+
+
+def parse_order_by(order_part: str) -> tuple[str, bool]:
+    """Парсит часть ORDER BY вида <столбец> [asc|desc]."""
+    parts = order_part.strip().split()
+    if not parts or len(parts) > 2:
+        raise ValueError(f"Некорректное значение: {order_part}. Попробуйте снова.")
+    direction = parts[1].lower() if len(parts) == 2 else "asc"
+    if direction not in ("asc", "desc"):
+        raise ValueError(f"Некорректное значение: {order_part}. Попробуйте снова.")
+    return parts[0], direction == "desc"
+
+
+def parse_select_command(
+    command: str,
+) -> tuple[
+    str,
+    List[str] | None,
+    Dict[str, Any] | None,
+    tuple[str, bool] | None,
+]:
     """Парсит команду select."""
     lower = command.lower()
     if " from " not in lower:
         raise ValueError("Некорректная команда select.")
-    if " where " in lower:
-        before_where, _, where_part = command.partition(" where ")
-        parts = before_where.strip().split()
-        if len(parts) < 3:
-            raise ValueError("Некорректная команда select.")
-        table_name = parts[2]
-        where_clause = parse_condition(where_part)
+
+    from_pos = lower.index(" from ")
+    columns = parse_projection(command[:from_pos])
+    rest = command[from_pos + len(" from "):]
+
+    order_by = None
+    if " order by " in rest.lower():
+        order_pos = rest.lower().rindex(" order by ")
+        order_by = parse_order_by(rest[order_pos + len(" order by "):])
+        rest = rest[:order_pos]
+
+    if " where " in rest.lower():
+        where_pos = rest.lower().index(" where ")
+        parts = rest[:where_pos].strip().split()
+        where_clause = parse_condition(rest[where_pos + len(" where "):])
     else:
-        parts = command.strip().split()
-        if len(parts) < 3:
-            raise ValueError("Некорректная команда select.")
-        table_name = parts[2]
+        parts = rest.strip().split()
         where_clause = None
-    return table_name, where_clause
+    if len(parts) != 1:
+        raise ValueError("Некорректная команда select.")
+    return parts[0], columns, where_clause, order_by
+
+
+def parse_create_view_command(
+    command: str,
+) -> tuple[str, str, List[str] | None, Dict[str, Any] | None]:
+    """Парсит команду create view <имя> as select ..."""
+    lower = command.lower()
+    if not lower.startswith("create view") or " as " not in lower:
+        raise ValueError("Некорректная команда create view.")
+
+    as_pos = lower.index(" as ")
+    head = command[:as_pos].strip().split()
+    if len(head) != 3:
+        raise ValueError("Некорректная команда create view.")
+    view_name = head[2]
+
+    select_part = command[as_pos + len(" as "):].strip()
+    if not select_part.lower().startswith("select"):
+        raise ValueError("Некорректная команда create view.")
+    table_name, columns, where_clause, order_by = parse_select_command(
+        select_part,
+    )
+    if order_by is not None:
+        raise ValueError("Некорректная команда create view.")
+    return view_name, table_name, columns, where_clause
+
+
+def parse_alter_command(
+    command: str,
+) -> tuple[str, str, str, str | None, Any]:
+    """Парсит команду alter_table <имя> add|drop ..."""
+    text, _, default_part = command.partition(" default ")
+    parts = text.strip().split()
+    if len(parts) != 4:
+        raise ValueError("Некорректная команда alter_table.")
+
+    _, table_name, action, column = parts
+    action = action.lower()
+    if action == "add":
+        name, col_type = parse_columns([column])[0]
+        default = _convert_literal(default_part) if default_part else None
+        return table_name, action, name, col_type, default
+    if action == "drop" and not default_part:
+        return table_name, action, column, None, None
+    raise ValueError("Некорректная команда alter_table.")
 
 
 def parse_update_command(
@@ -0,0 +1,110 @@
+"""Внешняя сортировка строк с ограничением по памяти."""
+
+from __future__ import annotations
+
+import functools
+import heapq
+import json
+import os
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List
+
+from .constants import DEFAULT_QUERY_MEMORY_BUDGET, MEMORY_BUDGET_ENV
+
+Row = Dict[str, Any]
+
+
+@functools.lru_cache(maxsize=None)
+def query_memory_budget() -> int:
+    """Возвращает бюджет памяти запроса в строках.
+
+    Значение читается из окружения при первом обращении; если оно
+    не является положительным целым, используется значение по умолчанию.
+    """
+    raw = os.environ.get(MEMORY_BUDGET_ENV)
+    if raw is None:
+        return DEFAULT_QUERY_MEMORY_BUDGET
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        print(
+            f"Некорректное значение {MEMORY_BUDGET_ENV}: {raw}. "
+            f"Используется {DEFAULT_QUERY_MEMORY_BUDGET}.",
+        )
+        return DEFAULT_QUERY_MEMORY_BUDGET
+    return value
+
+
+def _sort_key(column: str, descending: bool) -> Callable[[Row], Any]:
+    """Ключ сортировки по столбцу; пустые значения идут после остальных.
+
+    При descending=True ключ используется с reverse=True, поэтому признак
+    пустого значения инвертируется, и пустые значения остаются в конце.
+    """
+
+    def key(row: Row) -> Any:
+        value = row.get(column)
+        if descending:
+            return (value is not None, value)
+        return (value is None, value)
+
+    return key
+
+
+def _spill_run(
+    run: List[Row],
+    key: Callable[[Row], Any],
+    descending: bool,
+) -> IO[str]:
+    """Сортирует порцию строк и сбрасывает её во временный файл."""
+    import tempfile
+
+    run.sort(key=key, reverse=descending)
+    run_file = tempfile.TemporaryFile("w+", encoding="utf-8")
+    for row in run:
+        run_file.write(json.dumps(row, ensure_ascii=False))
+        run_file.write("\n")
+    run_file.seek(0)
+    return run_file
+
+
+def _read_run(run_file: IO[str]) -> Iterator[Row]:
+    """Построчно читает отсортированную порцию из временного файла."""
+    for line in run_file:
+        yield json.loads(line)
+
+
+def sort_rows(
+    rows: Iterable[Row],
+    column: str,
+    descending: bool = False,
+    memory_budget: int | None = None,
+) -> Iterator[Row]:
+    """Сортирует строки по столбцу, держа в памяти не больше memory_budget строк.
+
+    Если строк больше, отсортированные порции сбрасываются во временные
+    файлы, а результат отдаётся потоком через k-путевое слияние.
+    """
+    if memory_budget is None:
+        memory_budget = query_memory_budget()
+    key = _sort_key(column, descending)
+    run: List[Row] = []
+    run_files: List[IO[str]] = []
+    try:
+        for row in rows:
+            run.append(row)
+            if len(run) >= memory_budget:
+                run_files.append(_spill_run(run, key, descending))
+                run = []
+
+        run.sort(key=key, reverse=descending)
+        if not run_files:
+            yield from run
+            return
+
+        runs = [_read_run(run_file) for run_file in run_files]
+        yield from heapq.merge(*runs, run, key=key, reverse=descending)
+    finally:
+        for run_file in run_files:
+            run_file.close()
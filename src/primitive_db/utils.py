@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, Generator, Iterator, List, Tuple
 
 from .constants import DATA_DIR, META_FILE
 
@@ -31,22 +32,317 @@ def save_metadata(filepath: str, data: Dict[str, Any]) -> None:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-def load_table_data(table_name: str) -> List[Dict[str, Any]]:
-    """Загружает данные таблицы из JSON-файла."""
-    _ensure_data_dir()
-    path = os.path.join(DATA_DIR, f"{table_name}.json")
+def _encode_rows(
+    data: List[Dict[str, Any]],
+    str_columns: List[str],
+) -> Dict[str, Any]:
+    """Кодирует строковые столбцы словарём: значение хранится как код.
+
+    Кодируются только столбцы str_columns, в которых различных значений
+    не больше половины: для почти уникальных столбцов словарь не окупается.
+    """
+    dictionaries: Dict[str, List[str]] = {}
+    codes: Dict[str, Dict[str, int]] = {}
+    for col in str_columns:
+        present = [row[col] for row in data if row.get(col) is not None]
+        if len(set(present)) * 2 <= len(present):
+            dictionaries[col] = []
+            codes[col] = {}
+
+    rows: List[Dict[str, Any]] = []
+    for row in data:
+        encoded: Dict[str, Any] = {}
+        for col, value in row.items():
+            if col in codes and value is not None:
+                code = codes[col].get(value)
+                if code is None:
+                    code = len(dictionaries[col])
+                    codes[col][value] = code
+                    dictionaries[col].append(value)
+                value = code
+            encoded[col] = value
+        rows.append(encoded)
+
+    return {"dictionaries": dictionaries, "rows": rows}
+
+
+def _encode_where(
+    where_clause: Dict[str, Any],
+    codes: Dict[str, Dict[str, int]],
+    defaults: Dict[str, Any],
+) -> Dict[str, Any] | None:
+    """Переводит условие в коды словаря; None — если совпадений быть не может."""
+    encoded: Dict[str, Any] = {}
+    for col, value in where_clause.items():
+        if col in codes:
+            code = codes[col].get(value) if isinstance(value, str) else None
+            if code is None:
+                if defaults.get(col) != value:
+                    return None
+                code = -1
+            value = code
+        encoded[col] = value
+    return encoded
+
+
+def _raw_matches(
+    raw: Dict[str, Any],
+    condition: Dict[str, Any],
+    where_clause: Dict[str, Any],
+    defaults: Dict[str, Any],
+) -> bool:
+    """Проверяет закодированную строку; у старых строк — значение по умолчанию."""
+    for col, code in condition.items():
+        if col in raw:
+            if raw[col] != code:
+                return False
+        elif defaults.get(col) != where_clause[col]:
+            return False
+    return True
+
+
+_READ_CHUNK = 64 * 1024
+
+
+def _iter_table_file(path: str) -> Generator[Any, None, None]:
+    """Потоково читает файл таблицы.
+
+    Сначала отдаёт словари столбцов, затем закодированные строки по одной,
+    не загружая массив rows в память целиком. Поддерживает и старый формат
+    (просто список строк). Файл с испорченным заголовком читается как пустой,
+    ошибка в массиве строк приводит к json.JSONDecodeError.
+    """
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        f = open(path, "r", encoding="utf-8")
     except FileNotFoundError:
-        return []
-    except json.JSONDecodeError:
-        return []
+        return
+
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+
+    def read_more() -> bool:
+        nonlocal buf, pos
+        chunk = f.read(_READ_CHUNK)
+        if not chunk:
+            return False
+        buf = buf[pos:] + chunk
+        pos = 0
+        return True
+
+    def peek() -> str:
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if not read_more():
+                return ""
+
+    def expect(char: str) -> None:
+        nonlocal pos
+        if peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", buf, pos)
+        pos += 1
+
+    def decode_value() -> Any:
+        nonlocal pos
+        peek()
+        while True:
+            try:
+                value, pos = decoder.raw_decode(buf, pos)
+                return value
+            except json.JSONDecodeError:
+                if not read_more():
+                    raise
+
+    def items() -> Iterator[Any]:
+        nonlocal pos
+        if peek() == "]":
+            pos += 1
+            return
+        while True:
+            yield decode_value()
+            separator = peek()
+            pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ','", buf, pos)
+
+    with f:
+        try:
+            dictionaries: Dict[str, List[str]] = {}
+            in_rows = False
+            if peek() == "[":
+                pos += 1
+                in_rows = True
+            else:
+                expect("{")
+                while peek() != "}":
+                    key = decode_value()
+                    expect(":")
+                    if key == "rows":
+                        expect("[")
+                        in_rows = True
+                        break
+                    value = decode_value()
+                    if key == "dictionaries":
+                        dictionaries = value
+                    if peek() == ",":
+                        pos += 1
+        except json.JSONDecodeError:
+            return
+
+        yield dictionaries
+        if in_rows:
+            yield from items()
+
+
+def _open_table(
+    table_name: str,
+    where_clause: Dict[str, Any],
+    defaults: Dict[str, Any],
+) -> Tuple[
+    Generator[Any, None, None],
+    Dict[str, List[str]],
+    Dict[str, Any] | None,
+]:
+    """Открывает файл таблицы: поток строк, словари и условие в кодах."""
+    _ensure_data_dir()
+    path = os.path.join(DATA_DIR, f"{table_name}.json")
+    stream = _iter_table_file(path)
+    dictionaries = next(stream, None)
+    if dictionaries is None:
+        return stream, {}, None
+
+    values = {
+        col: [sys.intern(value) for value in col_values]
+        for col, col_values in dictionaries.items()
+    }
+    codes = {
+        col: {value: code for code, value in enumerate(col_values)}
+        for col, col_values in values.items()
+    }
+    condition = _encode_where(where_clause, codes, defaults)
+    return stream, values, condition
+
+
+def _decode_row(
+    raw: Dict[str, Any],
+    columns: List[str] | None,
+    values: Dict[str, List[str]],
+    defaults: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Декодирует строку, оставляя только столбцы columns."""
+    row: Dict[str, Any] = {}
+    for col in raw if columns is None else columns:
+        if col in raw:
+            value = raw[col]
+            if col in values and value is not None:
+                value = values[col][value]
+        elif col in defaults:
+            value = defaults[col]
+        else:
+            continue
+        row[col] = value
+    return row
+
+
+def iter_table_data(
+    table_name: str,
+    columns: List[str] | None = None,
+    where_clause: Dict[str, Any] | None = None,
+    defaults: Dict[str, Any] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Читает таблицу из JSON-файла и декодирует строки по одной.
+
+    Если передан список columns, в строках остаются только эти поля.
+    Условие where_clause проверяется по кодам словаря до декодирования строк.
+    Столбцы из defaults, которых нет в строке, получают значение по умолчанию.
+    """
+    where_clause = where_clause or {}
+    defaults = defaults or {}
+    rows, values, condition = _open_table(table_name, where_clause, defaults)
+    if condition is None:
+        rows.close()
+        return iter(())
+
+    return (
+        _decode_row(raw, columns, values, defaults)
+        for raw in rows
+        if _raw_matches(raw, condition, where_clause, defaults)
+    )
+
+
+def load_table_data(
+    table_name: str,
+    columns: List[str] | None = None,
+    where_clause: Dict[str, Any] | None = None,
+    defaults: Dict[str, Any] | None = None,
+) -> List[Dict[str, Any]]:
+    """Загружает данные таблицы из JSON-файла списком строк."""
+    return list(iter_table_data(table_name, columns, where_clause, defaults))
+
+
+def load_table_matches(
+    table_name: str,
+    where_clause: Dict[str, Any],
+    columns: List[str] | None = None,
+    defaults: Dict[str, Any] | None = None,
+) -> Tuple[List[Dict[str, Any]], List[int]]:
+    """Загружает все строки таблицы и позиции строк, подходящих под условие.
 
+    Условие проверяется по кодам словаря, как в iter_table_data.
+    """
+    defaults = defaults or {}
+    rows, values, condition = _open_table(table_name, where_clause, defaults)
+    table_data: List[Dict[str, Any]] = []
+    matched: List[int] = []
+    for index, raw in enumerate(rows):
+        table_data.append(_decode_row(raw, columns, values, defaults))
+        if condition is not None and _raw_matches(
+            raw,
+            condition,
+            where_clause,
+            defaults,
+        ):
+            matched.append(index)
+    return table_data, matched
 
-def save_table_data(table_name: str, data: List[Dict[str, Any]]) -> None:
-    """Сохраняет данные таблицы в JSON-файл."""
+
+def save_table_data(
+    table_name: str,
+    data: List[Dict[str, Any]],
+    str_columns: List[str] | None = None,
+) -> int:
+    """Сохраняет данные таблицы в JSON-файл со словарным кодированием строк.
+
+    Словарём кодируются столбцы типа str из str_columns.
+    Возвращает размер записанного файла в байтах.
+    """
     _ensure_data_dir()
     path = os.path.join(DATA_DIR, f"{table_name}.json")
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        payload = _encode_rows(data, str_columns or [])
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    return os.path.getsize(path)
+
+
+def delete_table_data(table_name: str) -> None:
+    """Удаляет JSON-файл с данными таблицы, если он есть."""
+    path = os.path.join(DATA_DIR, f"{table_name}.json")
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def get_table_size(table_name: str) -> int:
+    """Возвращает размер файла таблицы в байтах."""
+    path = os.path.join(DATA_DIR, f"{table_name}.json")
+    try:
+        return os.path.getsize(path)
+    except FileNotFoundError:
+        return 0
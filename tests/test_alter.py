@@ -0,0 +1,66 @@
+"""Проверка alter_table: удалённые столбцы не участвуют в условиях."""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from src.primitive_db import engine
+from src.primitive_db.utils import load_table_data
+
+
+class DroppedColumnTest(unittest.TestCase):
+    """Столбец, удалённый до перезаписи файла, скрыт и при фильтрации."""
+
+    def setUp(self) -> None:
+        self._cwd = os.getcwd()
+        self._workdir = tempfile.TemporaryDirectory()
+        os.chdir(self._workdir.name)
+        self.addCleanup(self._workdir.cleanup)
+        self.addCleanup(os.chdir, self._cwd)
+
+        self._run(
+            'create_table u name:str status:str',
+            'insert into u values ("a", "new")',
+            'insert into u values ("b", "new")',
+            'insert into u values ("c", "old")',
+            'insert into u values ("d", "new")',
+            "alter_table u drop status",
+        )
+
+    def _run(self, *commands: str) -> str:
+        output = io.StringIO()
+        inputs = iter([*commands, "exit"])
+
+        def fake_input(prompt: str = "") -> str:
+            if prompt.startswith("Вы уверены"):
+                return "y"
+            return next(inputs)
+
+        with mock.patch("builtins.input", fake_input), redirect_stdout(output):
+            engine.run()
+        return output.getvalue()
+
+    def _stored_rows(self) -> list[dict]:
+        return load_table_data("u")
+
+    def test_delete_by_dropped_column(self) -> None:
+        output = self._run('delete from u where status = "new"')
+        self.assertIn('столбец "status" не существует', output)
+        self.assertEqual([row["ID"] for row in self._stored_rows()], [1, 2, 3, 4])
+
+    def test_update_by_dropped_column(self) -> None:
+        output = self._run('update u set name = "zzz" where status = "new"')
+        self.assertIn('столбец "status" не существует', output)
+        names = [row["name"] for row in self._stored_rows()]
+        self.assertEqual(names, ["a", "b", "c", "d"])
+
+    def test_ordered_select_by_dropped_column(self) -> None:
+        output = self._run('select from u where status = "old" order by ID')
+        self.assertIn('столбец "status" не существует', output)
+
+
+if __name__ == "__main__":
+    unittest.main()
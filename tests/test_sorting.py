@@ -0,0 +1,45 @@
+"""Проверка внешней сортировки строк."""
+
+import unittest
+
+from src.primitive_db.sorting import sort_rows
+
+ROWS = [
+    {"ID": 1, "age": 30},
+    {"ID": 2, "age": None},
+    {"ID": 3, "age": 10},
+    {"ID": 4, "age": 20},
+    {"ID": 5, "age": None},
+    {"ID": 6, "age": 10},
+    {"ID": 7, "age": 40},
+]
+
+
+class SortRowsTest(unittest.TestCase):
+    """Результат не зависит от того, были ли порции сброшены на диск."""
+
+    def _ids(self, descending: bool, memory_budget: int) -> list[int]:
+        rows = sort_rows(iter(ROWS), "age", descending, memory_budget)
+        return [row["ID"] for row in rows]
+
+    def test_ascending_with_spill(self) -> None:
+        self.assertEqual(self._ids(False, 2), [3, 6, 4, 1, 7, 2, 5])
+
+    def test_descending_with_spill(self) -> None:
+        self.assertEqual(self._ids(True, 2), [7, 1, 4, 3, 6, 2, 5])
+
+    def test_nulls_last_in_both_directions(self) -> None:
+        for descending in (False, True):
+            ids = self._ids(descending, 3)
+            self.assertEqual(ids[-2:], [2, 5])
+
+    def test_spill_matches_in_memory_sort(self) -> None:
+        for descending in (False, True):
+            self.assertEqual(
+                self._ids(descending, 1),
+                self._ids(descending, len(ROWS)),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""Проверка времени запуска примитивной базы данных."""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Допустимое время запуска процесса до первой команды, в секундах.
+STARTUP_BUDGET = 1.0
+
+BOOT_SCRIPT = """
+import sys
+from src.primitive_db import main
+main.main()
+print("prompt" in sys.modules, "prettytable" in sys.modules, "tempfile" in sys.modules)
+"""
+
+
+class StartupTest(unittest.TestCase):
+    """Запуск не должен тянуть тяжёлые модули и читать таблицы."""
+
+    def _boot(self) -> tuple[subprocess.CompletedProcess, float]:
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        with tempfile.TemporaryDirectory() as workdir:
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", BOOT_SCRIPT],
+                cwd=workdir,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            elapsed = time.perf_counter() - start
+        return result, elapsed
+
+    def test_startup_within_budget(self) -> None:
+        result, elapsed = self._boot()
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertLess(elapsed, STARTUP_BUDGET)
+
+    def test_heavy_modules_not_imported(self) -> None:
+        result, _ = self._boot()
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "False False False")
+
+
+if __name__ == "__main__":
+    unittest.main()